@@ -1,14 +1,52 @@
 """Helper functions, not project specific."""
 
-import io
+import json
 import logging
 import os
+import shutil
+import tempfile
 import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import numpy as np
 import pandas as pd
 import requests
 
+# Minimum uncompressed size of the extracted files to extract them in parallel
+PARALLEL_EXTRACT_MIN_SIZE = 64 * 1024**2
+
+
+def _extract_member(
+    z: zipfile.ZipFile,
+    file: str,
+    target_path: str,
+    staging_path: str,
+) -> None:
+    """
+    Extract one file from zip to local path, atomically.
+
+    The file is first extracted to its own directory in `staging_path`, then
+    moved to `target_path` once it is fully decompressed and its CRC checked,
+    so a corrupted member never leaves a partial file in `target_path`.
+
+    Args:
+        z: Zip file to extract from.
+        file: Name of file to extract from zip.
+        target_path: Path to extract file to.
+        staging_path: Path to extract file to, before moving it to target_path.
+
+    Returns:
+        None
+    """
+    member_path = tempfile.mkdtemp(dir=staging_path)
+    extracted_path = z.extract(file, member_path)
+
+    file_path = os.path.join(target_path, os.path.relpath(extracted_path, member_path))
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    os.replace(extracted_path, file_path)
+
 
 def download_extract_zip(
     zip_file_url: str,
@@ -20,7 +58,9 @@ def download_extract_zip(
 
     - Check if content files already exist.
         - If they all exist, return.
-        - If not, download zip file and extract content files.
+        - If not, download zip file (unless the cached copy in
+          `target_path/.cache` is still up to date) and extract only the
+          content files.
 
     Args:
         zip_file_url: Url of zip file to download.
@@ -46,25 +86,106 @@ def download_extract_zip(
         logging.info("All files already exist in %s", target_path)
         return
 
-    # Download zip file
-    r = requests.get(zip_file_url)
-    if r.status_code != 200:
-        raise ValueError(f"Failed to download {zip_file_url}")
-
-    with zipfile.ZipFile(io.BytesIO(r.content)) as z:
-        # Check if zip file is OK
-        if z.testzip() is not None:
-            raise ValueError(f"Failed to extract {zip_file_url}")
-
-        # Check if content path exists
-        if not os.path.exists(target_path):
-            logging.info("Creating %s", target_path)
-            os.makedirs(target_path)
-
-        # Extract files from zip
-        logging.info("Extracting %s to %s", zip_file_url, target_path)
-        z.extractall(target_path)
-        logging.info("Extracted %s to %s", zip_file_url, target_path)
+    # Zip file is cached with its url and validators (ETag / Last-Modified)
+    cache_path = os.path.join(target_path, ".cache")
+    archive_path = os.path.join(cache_path, "archive.zip")
+    validators_path = os.path.join(cache_path, "archive.json")
+
+    # Only download zip file if it changed since it was cached (conditional GET)
+    headers = {}
+    if os.path.exists(archive_path) and os.path.exists(validators_path):
+        with open(validators_path, encoding="utf-8") as f:
+            validators = json.load(f)
+        if validators.get("url") != zip_file_url:
+            # Cached zip file was downloaded from another url
+            validators = {}
+        if "ETag" in validators:
+            headers["If-None-Match"] = validators["ETag"]
+        if "Last-Modified" in validators:
+            headers["If-Modified-Since"] = validators["Last-Modified"]
+
+    logging.info("Downloading %s", zip_file_url)
+    with requests.get(zip_file_url, headers=headers, stream=True, timeout=30) as r:
+        if r.status_code == 304 and headers:
+            # "Not modified" only makes sense for a conditional GET, i.e. when
+            # the zip file is cached for this url
+            logging.info("%s not modified, using %s", zip_file_url, archive_path)
+        elif r.status_code == 200:
+            # Check if cache path exists
+            if not os.path.exists(cache_path):
+                logging.info("Creating %s", cache_path)
+                os.makedirs(cache_path)
+
+            # Download zip file to a partial file, chunk by chunk
+            with open(f"{archive_path}.part", "wb") as f:
+                for chunk in r.iter_content(chunk_size=1 << 20):
+                    if chunk:
+                        f.write(chunk)
+            os.replace(f"{archive_path}.part", archive_path)
+
+            with open(validators_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "url": zip_file_url,
+                        **{
+                            header: r.headers[header]
+                            for header in ("ETag", "Last-Modified")
+                            if header in r.headers
+                        },
+                    },
+                    f,
+                )
+        else:
+            raise ValueError(f"Failed to download {zip_file_url}")
+
+    # Files are extracted to a staging directory first, see _extract_member
+    staging_path = tempfile.mkdtemp(dir=cache_path)
+
+    try:
+        with zipfile.ZipFile(archive_path) as z:
+            # Check that all requested files are in the zip file
+            missing_files = set(files_names) - set(z.namelist())
+            if missing_files:
+                raise ValueError(
+                    f"Files {sorted(missing_files)} not found in {zip_file_url}"
+                )
+
+            # Extract requested files from zip, corrupted members are
+            # detected while decompressing them (CRC check)
+            logging.info("Extracting %s to %s", zip_file_url, target_path)
+            extract_size = sum(z.getinfo(file).file_size for file in files_names)
+            if len(files_names) > 1 and extract_size >= PARALLEL_EXTRACT_MIN_SIZE:
+                # zlib releases the GIL while decompressing, so members are
+                # decompressed in parallel by threads (each member is extracted
+                # to its own staging directory, so extractions do not race to
+                # create the same directories)
+                with ThreadPoolExecutor(
+                    max_workers=min(len(files_names), os.cpu_count() or 1)
+                ) as executor:
+                    list(
+                        executor.map(
+                            partial(
+                                _extract_member,
+                                z,
+                                target_path=target_path,
+                                staging_path=staging_path,
+                            ),
+                            files_names,
+                        )
+                    )
+            else:
+                for file in files_names:
+                    _extract_member(z, file, target_path, staging_path)
+            logging.info("Extracted %s to %s", zip_file_url, target_path)
+    except (zipfile.BadZipFile, zlib.error) as e:
+        # Remove corrupted zip file from cache, so it is downloaded again
+        os.remove(archive_path)
+        os.remove(validators_path)
+        logging.error("Failed to extract %s : %s", zip_file_url, e)
+        raise ValueError(f"Failed to extract {zip_file_url}") from e
+    finally:
+        # Remove partially extracted files
+        shutil.rmtree(staging_path)
 
 
 def load_data_from_csv(  # pylint: disable=too-many-arguments
@@ -214,11 +335,7 @@ def balance_sample(df: pd.DataFrame, column: str, sample_size: int) -> pd.DataFr
         pd.DataFrame: Sampled and balanced dataframe.
     """
     return (
-        df.groupby(column, group_keys=False)
-        .apply(
-            lambda x: x.sample(
-                n=int(sample_size / df[column].nunique()), random_state=42
-            )
-        )
+        df.groupby(column)
+        .sample(n=int(sample_size / df[column].nunique()), random_state=42)
         .reset_index(drop=True)
     )
@@ -3,6 +3,7 @@
 import json
 from typing import Union
 
+import numpy as np
 import pandas as pd
 
 
@@ -26,12 +27,16 @@ def drop_impossible_values(
         }
     }
     """
-    for col in dataframe.columns:
-        if col in constraints:
-            dataframe = dataframe[
-                dataframe[col].between(constraints[col]["min"], constraints[col]["max"])
-            ]
-    return dataframe
+    # Combine all constraints in a single mask, then filter the dataframe once
+    mask = np.ones(len(dataframe.index), dtype=bool)
+    for col, constraint in constraints.items():
+        if col in dataframe.columns:
+            mask &= (
+                dataframe[col]
+                .between(constraint["min"], constraint["max"])
+                .to_numpy(dtype=bool, na_value=False)
+            )
+    return dataframe.loc[mask]
 
 
 def one_hot_encode_list_variables(
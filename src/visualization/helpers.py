@@ -2,6 +2,7 @@
 import logging
 from typing import Callable, Dict, List, Optional, Tuple, Union
 
+import joblib
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
@@ -13,7 +14,7 @@ from numpy.core.fromnumeric import (  # noqa: F401,W0611 # pylint: disable=unuse
     repeat,
     shape,
 )
-from scipy.stats import f_oneway
+from scipy.stats import f as f_distribution
 from sklearn.base import ClassifierMixin, is_classifier
 from sklearn.decomposition import PCA
 from sklearn.inspection import permutation_importance
@@ -22,6 +23,7 @@ from sklearn.metrics import (
     PrecisionRecallDisplay,
     RocCurveDisplay,
 )
+from sklearn.utils import Bunch
 
 # Set the default theme
 template = go.layout.Template()
@@ -59,6 +61,11 @@ pio.templates.default = "plotly_white+custom_template"
 # in this text being inconsistent
 colours_trendline = px.colors.qualitative.Set1
 
+# Permutation importances already computed, keyed by a hash of their inputs
+# (model, X, y and n_repeats), so that re-plotting the same fit is instant
+PERMUTATION_IMPORTANCES_CACHE_SIZE = 16
+_permutation_importances_cache: Dict[str, Bunch] = {}
+
 
 def _to_human_readable(text: str):
     """
@@ -319,9 +326,6 @@ def line_2D(  # pylint: disable=too-many-locals
     if isinstance(trendline, tuple):
         trendline = [trendline]
 
-    x: np.ndarray = np.array([])
-    y: np.ndarray = np.array([])
-
     if len(x_range) == 2:
         x_vals = np.linspace(x_range[0], x_range[1], num=200)
     else:
@@ -332,25 +336,23 @@ def line_2D(  # pylint: disable=too-many-locals
         # Rewrite x_range to actually be an x-axis range
         x_range = (x_vals[0], x_vals[-1])
 
-    names = []  # type: ignore
+    lines_names = []
+    lines_y: List[np.ndarray] = []
 
     if isinstance(trendline, dict):
         for cur in trendline.items():
-            name = cur[0]
-            x = np.concatenate([x, x_vals])
-            names = names + ([name] * len(x_vals))
-            y = np.concatenate([y, cur[1]])
+            lines_names.append(cur[0])
+            lines_y.append(np.asarray(cur[1]))
     else:
         for cur in trendline:  # type: ignore
-            name = cur[0]
-            x = np.concatenate([x, x_vals])
-            names = names + ([name] * len(x_vals))
-            y = np.concatenate([y, cur[1](x=x_vals)])  # type: ignore
+            lines_names.append(cur[0])
+            lines_y.append(np.asarray(cur[1](x=x_vals)))  # type: ignore
 
+    # Concatenate all lines at once, rather than growing arrays line by line
     data = {}
-    data[label_x] = x
-    data[label_y] = y
-    data[legend_title] = names  # type: ignore
+    data[label_x] = np.tile(x_vals, len(lines_names))
+    data[label_y] = np.concatenate(lines_y) if lines_y else np.array([])
+    data[legend_title] = np.repeat(lines_names, len(x_vals))
 
     df = pd.DataFrame(data)
 
@@ -605,10 +607,7 @@ def model_to_surface_plot(model, plot_features: List[str], data: pd.DataFrame):
     mins = np.min(data[plot_features], axis=0)
     maxes = np.max(data[plot_features], axis=0)
 
-    df = pd.DataFrame()
-
-    for f, m in zip(other_features, means):
-        df[f] = [m]
+    df = pd.DataFrame([means], columns=other_features)
 
     def predict(x, y):
         """
@@ -675,6 +674,81 @@ def save_plot_as_image(  # pylint: disable=too-many-arguments
     )
 
 
+def _nan_column_statistics(
+    values: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the count, mean and sum of squared deviations of each column of a
+    2D array, ignoring NaN values.
+
+    The NaN mask is computed once and reused for every statistic, instead of
+    being recomputed by each `np.nanmean` / `np.nanvar` call, and NaN values
+    are masked in place rather than dropped. Values are first shifted by the
+    first non-NaN value of their column, so that columns with a large offset
+    (e.g. timestamps) do not lose precision, and constant columns have no
+    deviation at all.
+
+    Args:
+        values (np.ndarray): 2D array of float64 values.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The count, mean and sum of
+            squared deviations of each column.
+    """
+    missing = np.isnan(values)
+    count = len(values) - missing.sum(axis=0)
+
+    # First non-NaN value of each column (NaN if there is none)
+    reference = np.zeros(values.shape[1])
+    if len(values):
+        reference = values[np.argmax(~missing, axis=0), np.arange(values.shape[1])]
+
+    # A single copy of values is allocated, then centered in place
+    deviations = values - reference
+    deviations[missing] = 0
+    shift = deviations.sum(axis=0) / count
+    deviations -= shift
+    deviations[missing] = 0
+    squared_deviations = np.einsum("ij,ij->j", deviations, deviations)
+
+    return count, reference + shift, squared_deviations
+
+
+def _oneway_anova_p_values(
+    values_0: np.ndarray,
+    values_1: np.ndarray,
+) -> np.ndarray:
+    """
+    Compute the one-way ANOVA p-value of each column of two samples at once,
+    ignoring NaN values (same results as `scipy.stats.f_oneway` column by
+    column).
+
+    Args:
+        values_0 (np.ndarray): 2D array of the first sample.
+        values_1 (np.ndarray): 2D array of the second sample.
+
+    Returns:
+        np.ndarray: The p-value of each column.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        n_0, mean_0, ss_0 = _nan_column_statistics(values_0)
+        n_1, mean_1, ss_1 = _nan_column_statistics(values_1)
+
+        # Sum of squares between and within groups (with 2 groups, the sum of
+        # squares between groups only depends on the difference of their means,
+        # so it is exactly 0 when they are equal)
+        ss_between = n_0 * n_1 / (n_0 + n_1) * (mean_0 - mean_1) ** 2
+        ss_within = ss_0 + ss_1
+
+        # Degrees of freedom between (2 groups - 1) and within groups
+        df_between = 1
+        df_within = n_0 + n_1 - 2
+
+        f_statistic = (ss_between / df_between) / (ss_within / df_within)
+
+    return f_distribution.sf(f_statistic, df_between, df_within)
+
+
 def plot_oneway_anova_p_values(
     dataframe: pd.DataFrame,
     categorical_column: str,
@@ -692,13 +766,21 @@ def plot_oneway_anova_p_values(
     Returns:
         None.
     """
-    anova = pd.DataFrame({})
+    numerical_columns = dataframe.select_dtypes("number").columns
+    values = dataframe[numerical_columns].to_numpy(dtype=float, na_value=np.nan)
+
+    # Classes masks only depend on the categorical column
+    mask_0 = (dataframe[categorical_column] == classes[0]).to_numpy(
+        dtype=bool, na_value=False
+    )
+    mask_1 = (dataframe[categorical_column] == classes[1]).to_numpy(
+        dtype=bool, na_value=False
+    )
 
-    for col in dataframe.select_dtypes("number").columns:
-        anova.loc[col, "p_value"] = f_oneway(
-            dataframe.loc[dataframe[categorical_column] == classes[0], col].dropna(),
-            dataframe.loc[dataframe[categorical_column] == classes[1], col].dropna(),
-        )[1]
+    anova = pd.DataFrame(
+        {"p_value": _oneway_anova_p_values(values[mask_0], values[mask_1])},
+        index=numerical_columns,
+    )
 
     # Plot the bar chart with Plotly Express
     fig = px.bar(
@@ -732,19 +814,13 @@ def plot_empty_values(dataframe: pd.DataFrame) -> None:
         return
 
     # Get the percentage of empty values per column
-    columns_emptiness = (
-        pd.DataFrame(
-            {
-                col: {
-                    "count": dataframe[col].isna().sum(),
-                    "percent": 100 * dataframe[col].isna().sum() / num_rows,
-                }
-                for col in dataframe.columns
-            }
-        )
-        .transpose()
-        .sort_values(by=["count"])
-    )
+    empty_counts = dataframe.isna().sum()
+    columns_emptiness = pd.DataFrame(
+        {
+            "count": empty_counts,
+            "percent": 100 * empty_counts / num_rows,
+        }
+    ).sort_values(by=["count"])
 
     # Plot the bar chart with Plotly Express
     fig = px.bar(
@@ -784,23 +860,19 @@ def plot_categories_bars(
     Returns : None
     """
     if plot_columns is None:
-        plot_columns = dataframe.select_dtypes(
-            include=["bool", "category"],
-        ).columns.tolist()
+        plot_columns = (
+            dataframe.select_dtypes(
+                include=["bool", "category"],
+            )
+            .columns.drop(categorical_column, errors="ignore")
+            .tolist()
+        )
 
     for col in plot_columns:
-        df_g = (
-            dataframe.groupby([col, categorical_column], dropna=False)
-            .size()
-            .reset_index()
-        )
-        df_g["percentage"] = (
-            dataframe.groupby([col, categorical_column], dropna=False)
-            .size()
-            .groupby(level=0)
-            .apply(lambda x: 100 * x / float(x.sum()))
-            .values
-        )
+        counts = dataframe.groupby([col, categorical_column], dropna=False).size()
+        totals = counts.groupby(level=0, dropna=False).transform("sum")
+        df_g = counts.reset_index()
+        df_g["percentage"] = (100 * counts / totals).values
         df_g.columns = [col, categorical_column, "Count", "Percentage"]
         df_g.sort_values(
             by=["Count", "Percentage"],
@@ -821,6 +893,51 @@ def plot_categories_bars(
         fig.show()
 
 
+def _box_statistics(values: pd.Series, groups: pd.Series) -> pd.DataFrame:
+    """
+    Compute the statistics of one boxplot per group, as Plotly would compute
+    them from the raw values : "hazen" quartiles (Plotly's default "linear"
+    quartile method) and population standard deviation.
+
+    Args:
+        values (pd.Series): The values to summarize.
+        groups (pd.Series): The group of each value.
+
+    Returns:
+        pd.DataFrame: One row per group, with the q1, median, q3, lowerfence,
+            upperfence, mean, sd and notchspan columns.
+    """
+
+    def quartiles(group_values: pd.Series) -> pd.Series:
+        """
+        Compute the quartiles of a group, NaN if it has no value.
+        """
+        group_values = group_values.dropna()
+        return pd.Series(
+            np.quantile(group_values, [0.25, 0.5, 0.75], method="hazen")
+            if len(group_values) > 0
+            else np.nan,
+            index=["q1", "median", "q3"],
+        )
+
+    grouped = values.groupby(groups)
+    stats = grouped.apply(quartiles).unstack()
+    stats["mean"] = grouped.mean()
+    stats["sd"] = grouped.std(ddof=0)
+    iqr = stats["q3"] - stats["q1"]
+
+    # Whiskers end at the most extreme values within 1.5 IQR of the quartiles
+    lower_limit = (stats["q1"] - 1.5 * iqr).reindex(groups).to_numpy()
+    upper_limit = (stats["q3"] + 1.5 * iqr).reindex(groups).to_numpy()
+    stats["lowerfence"] = values.where(values >= lower_limit).groupby(groups).min()
+    stats["upperfence"] = values.where(values <= upper_limit).groupby(groups).max()
+
+    # Notches span the 95% confidence interval of the median
+    stats["notchspan"] = 1.57 * iqr / np.sqrt(grouped.count())
+
+    return stats
+
+
 def plot_boxes(
     dataframe: pd.DataFrame,
     plot_columns: Optional[list[str]] = None,
@@ -841,18 +958,43 @@ def plot_boxes(
     if plot_columns is None:
         plot_columns = dataframe.select_dtypes(include="number").columns.tolist()
 
+    # Without categorical column, all rows are in the same box
+    groups = (
+        dataframe[categorical_column]
+        if categorical_column is not None
+        else pd.Series("all", index=dataframe.index)
+    )
+
     for col in plot_columns:
-        fig = px.box(
-            dataframe,
-            y=col,
-            points=False,
-            color=categorical_column,
-            title=f"{col} distribution per TARGET",
-            width=800,
-            height=400,
+        stats = _box_statistics(dataframe[col].astype(float), groups)
+
+        # Only the boxes statistics are sent to Plotly, not the raw values
+        fig = go.Figure(
+            layout=dict(
+                title=f"{col} distribution per TARGET",
+                width=800,
+                height=400,
+                yaxis_title_text=col,
+                legend_title_text=categorical_column,
+            )
         )
-        fig.update_traces(boxmean="sd")
-        fig.update_traces(notched=True)
+        for category, category_stats in stats.iterrows():
+            fig.add_trace(
+                go.Box(
+                    name=str(category),
+                    x=[str(category)],
+                    q1=[category_stats["q1"]],
+                    median=[category_stats["median"]],
+                    q3=[category_stats["q3"]],
+                    lowerfence=[category_stats["lowerfence"]],
+                    upperfence=[category_stats["upperfence"]],
+                    mean=[category_stats["mean"]],
+                    sd=[category_stats["sd"]],
+                    notchspan=[category_stats["notchspan"]],
+                    boxmean="sd",
+                    notched=True,
+                )
+            )
         fig.show()
 
 
@@ -872,63 +1014,99 @@ def plot_classifier_results(  # pylint: disable=too-many-arguments
         classifier (ClassifierMixin): sklearn Classifier
         X (pd.DataFrame): test data
         y_true (pd.Series): true values
-        y_pred (pd.Series): predicted values
-        y_pred_proba (pd.Series): predicted values probabilities
+        y_pred (pd.Series): predicted values, predicted with classifier if None
+        y_pred_proba (pd.Series): predicted values probabilities, predicted with
+            classifier if None
     """
     if (y_pred_proba is None or y_pred is None) and not is_classifier(classifier):
         raise ValueError(f"{classifier} is not a classifier.")
 
+    # Predict once and share predictions between all displays
+    pos_label = None
+    if y_pred is None:
+        y_pred = classifier.predict(X)
+    if y_pred_proba is None:
+        if hasattr(classifier, "predict_proba"):
+            y_pred_proba = classifier.predict_proba(X)[:, 1]
+        else:
+            y_pred_proba = classifier.decision_function(X)
+        pos_label = classifier.classes_[1]
+
     _, ax = plt.subplots(
         nrows=1,
         ncols=3,
         figsize=(24, 8),
     )
 
-    if y_pred_proba is None or y_pred is None:
-        ConfusionMatrixDisplay.from_estimator(
-            classifier,
-            X,
-            y_true,
-            ax=ax[0],
-        )
-        PrecisionRecallDisplay.from_estimator(
-            classifier,
-            X,
-            y_true,
-            name=classifier.__class__.__name__,
-            ax=ax[1],
-        )
-        RocCurveDisplay.from_estimator(
-            classifier,
-            X,
-            y_true,
-            name=classifier.__class__.__name__,
-            ax=ax[2],
-        )
-    else:
-        ConfusionMatrixDisplay.from_predictions(
-            y_true,
-            y_pred,
-            ax=ax[0],
-        )
-        PrecisionRecallDisplay.from_predictions(
-            y_true,
-            y_pred_proba,
-            name=classifier.__class__.__name__,
-            ax=ax[1],
-        )
-        RocCurveDisplay.from_predictions(
-            y_true,
-            y_pred_proba,
-            name=classifier.__class__.__name__,
-            ax=ax[2],
-        )
+    ConfusionMatrixDisplay.from_predictions(
+        y_true,
+        y_pred,
+        ax=ax[0],
+    )
+    PrecisionRecallDisplay.from_predictions(
+        y_true,
+        y_pred_proba,
+        pos_label=pos_label,
+        name=classifier.__class__.__name__,
+        ax=ax[1],
+    )
+    RocCurveDisplay.from_predictions(
+        y_true,
+        y_pred_proba,
+        pos_label=pos_label,
+        name=classifier.__class__.__name__,
+        ax=ax[2],
+    )
 
     plt.suptitle(title)
 
     plt.show()
 
 
+def _cached_permutation_importance(
+    model: ClassifierMixin,
+    X: pd.DataFrame,
+    y: pd.Series,
+    n_repeats: int = 10,
+) -> Bunch:
+    """
+    Compute the permutation importances of each variable, or return them from
+    the cache if they were already computed for the same inputs.
+
+    The cache key is a hash of the model (including its fitted state), X, y and
+    n_repeats, so a model re-fitted in place is not served stale results.
+
+    Args:
+        model (ClassifierMixin): Fitted classifier
+        X (pd.DataFrame): X variables
+        y (pd.Series): Target variable
+        n_repeats (int): Number of times to permute each variable
+
+    Returns:
+        Bunch: The permutation importances, see
+            `sklearn.inspection.permutation_importance`
+    """
+    key = joblib.hash((model, X, y, n_repeats))
+
+    if key not in _permutation_importances_cache:
+        if len(_permutation_importances_cache) >= PERMUTATION_IMPORTANCES_CACHE_SIZE:
+            # Evict the oldest entry
+            del _permutation_importances_cache[
+                next(iter(_permutation_importances_cache))
+            ]
+
+        _permutation_importances_cache[key] = permutation_importance(
+            model,
+            X,
+            y,
+            n_repeats=n_repeats,
+            random_state=42,
+            n_jobs=-1,
+        )
+
+    return _permutation_importances_cache[key]
+
+
 def plot_permutation_importance(
     model: ClassifierMixin,
     X: pd.DataFrame,
@@ -941,14 +1119,7 @@ def plot_permutation_importance(
         X (pd.DataFrame): X variables
         y (pd.Series): Targer variable
     """
-    importances = permutation_importance(
-        model,
-        X,
-        y,
-        n_repeats=10,
-        random_state=42,
-        n_jobs=-1,
-    )
+    importances = _cached_permutation_importance(model, X, y, n_repeats=10)
     sorted_idx = importances.importances_mean.argsort()
     sorted_idx = list(sorted_idx[:10]) + list(sorted_idx[-10:])
 
@@ -976,8 +1147,14 @@ def plot_pca_2d(
 
     Returns : None
     """
-    pca = PCA(n_components=2)
-    data_pca = pca.fit_transform(data)
+    # Only the first 2 components are needed : randomized SVD avoids the full
+    # decomposition of the data
+    pca = PCA(n_components=2, svd_solver="randomized", random_state=42)
+    # Center in float64 before the float32 downcast, so large-magnitude columns
+    # (e.g. timestamps) keep their precision
+    X = data.to_numpy(dtype=float)
+    X = X - X.mean(axis=0)
+    data_pca = pca.fit_transform(np.ascontiguousarray(X, dtype=np.float32))
 
     # Plot the data in the PCA space
     fig = px.scatter(
@@ -0,0 +1,204 @@
+"""Tests for the data helpers module"""
+
+import io
+import json
+import os
+import zipfile
+
+import pytest
+
+from src.data import helpers
+
+URL = "https://example.com/archive.zip"
+
+
+def make_zip(files: dict[str, str], compression: int = zipfile.ZIP_DEFLATED) -> bytes:
+    """Build a zip file in memory."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression) as z:
+        for name, content in files.items():
+            z.writestr(name, content)
+    return buffer.getvalue()
+
+
+def corrupt_member(content: bytes, marker: bytes) -> bytes:
+    """Flip a byte of a stored member, so that its CRC check fails."""
+    corrupted = bytearray(content)
+    corrupted[corrupted.index(marker)] ^= 0xFF
+    return bytes(corrupted)
+
+
+class FakeResponse:
+    """Minimal streamed `requests` response."""
+
+    def __init__(self, status_code: int, content: bytes = b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def iter_content(self, chunk_size: int):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i : i + chunk_size]
+
+
+@pytest.fixture(name="fake_get")
+def fixture_fake_get(monkeypatch):
+    """Replace `requests.get` by a stub returning queued responses."""
+    calls = []
+    responses = []
+
+    def fake_get(url, headers=None, **kwargs):
+        calls.append({"url": url, "headers": headers or {}, **kwargs})
+        return responses.pop(0)
+
+    monkeypatch.setattr(helpers.requests, "get", fake_get)
+    return calls, responses
+
+
+def read(path) -> str:
+    """Read a text file."""
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def test_download_extract_zip_200(tmp_path, fake_get):
+    calls, responses = fake_get
+    responses.append(
+        FakeResponse(
+            200,
+            make_zip({"a.csv": "a\n1\n", "dir/b.csv": "b\n2\n", "other.txt": "x"}),
+            {"ETag": '"v1"'},
+        )
+    )
+
+    helpers.download_extract_zip(URL, ("a.csv", "dir/b.csv"), str(tmp_path))
+
+    assert read(tmp_path / "a.csv") == "a\n1\n"  # nosec: B101
+    assert read(tmp_path / "dir" / "b.csv") == "b\n2\n"  # nosec: B101
+    assert not (tmp_path / "other.txt").exists()  # nosec: B101
+    assert calls[0]["headers"] == {}  # nosec: B101
+    assert json.loads(read(tmp_path / ".cache" / "archive.json")) == {  # nosec: B101
+        "url": URL,
+        "ETag": '"v1"',
+    }
+    assert sorted(os.listdir(tmp_path / ".cache")) == [  # nosec: B101
+        "archive.json",
+        "archive.zip",
+    ]
+
+    # All files exist : nothing is downloaded
+    helpers.download_extract_zip(URL, ("a.csv", "dir/b.csv"), str(tmp_path))
+    assert len(calls) == 1  # nosec: B101
+
+
+def test_download_extract_zip_304(tmp_path, fake_get):
+    calls, responses = fake_get
+    responses.append(
+        FakeResponse(
+            200,
+            make_zip({"a.csv": "a\n1\n"}),
+            {"ETag": '"v1"', "Last-Modified": "Mon, 01 Aug 2022 00:00:00 GMT"},
+        )
+    )
+    helpers.download_extract_zip(URL, ("a.csv",), str(tmp_path))
+    os.remove(tmp_path / "a.csv")
+
+    # Zip file did not change : files are extracted from the cached zip file
+    responses.append(FakeResponse(304))
+    helpers.download_extract_zip(URL, ("a.csv",), str(tmp_path))
+
+    assert calls[1]["headers"] == {  # nosec: B101
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Aug 2022 00:00:00 GMT",
+    }
+    assert read(tmp_path / "a.csv") == "a\n1\n"  # nosec: B101
+
+
+def test_download_extract_zip_304_not_requested(tmp_path, fake_get):
+    _, responses = fake_get
+
+    # No zip file is cached : a 304 response can not be trusted
+    responses.append(FakeResponse(304))
+    with pytest.raises(ValueError, match="Failed to download"):
+        helpers.download_extract_zip(URL, ("a.csv",), str(tmp_path))
+
+    responses.append(FakeResponse(200, make_zip({"a.csv": "a\n1\n"}), {"ETag": '"v1"'}))
+    helpers.download_extract_zip(URL, ("a.csv",), str(tmp_path))
+    os.remove(tmp_path / "a.csv")
+
+    # Cached zip file belongs to another url : no conditional headers are sent
+    responses.append(FakeResponse(304))
+    with pytest.raises(ValueError, match="Failed to download"):
+        helpers.download_extract_zip(f"{URL}?v=2", ("a.csv",), str(tmp_path))
+
+
+def test_download_extract_zip_other_url(tmp_path, fake_get):
+    calls, responses = fake_get
+    responses.append(
+        FakeResponse(
+            200,
+            make_zip({"a.csv": "a\n1\n"}),
+            {"Last-Modified": "Mon, 01 Aug 2022 00:00:00 GMT"},
+        )
+    )
+    helpers.download_extract_zip(URL, ("a.csv",), str(tmp_path))
+
+    # Validators of the cached zip file are not sent to another url
+    responses.append(FakeResponse(200, make_zip({"b.csv": "b\n2\n"})))
+    helpers.download_extract_zip(f"{URL}?v=2", ("b.csv",), str(tmp_path))
+
+    assert calls[1]["headers"] == {}  # nosec: B101
+    assert read(tmp_path / "b.csv") == "b\n2\n"  # nosec: B101
+
+
+def test_download_extract_zip_not_200(tmp_path, fake_get):
+    _, responses = fake_get
+    responses.append(FakeResponse(404))
+
+    with pytest.raises(ValueError, match="Failed to download"):
+        helpers.download_extract_zip(URL, ("a.csv",), str(tmp_path))
+
+    assert not (tmp_path / "a.csv").exists()  # nosec: B101
+
+
+def test_download_extract_zip_missing_file(tmp_path, fake_get):
+    _, responses = fake_get
+    responses.append(FakeResponse(200, make_zip({"a.csv": "a\n1\n"})))
+
+    with pytest.raises(ValueError, match="not found"):
+        helpers.download_extract_zip(URL, ("a.csv", "b.csv"), str(tmp_path))
+
+    assert not (tmp_path / "a.csv").exists()  # nosec: B101
+
+
+@pytest.mark.parametrize("parallel_extract_min_size", [0, 64 * 1024**2])
+def test_download_extract_zip_corrupted(
+    tmp_path, fake_get, monkeypatch, parallel_extract_min_size
+):
+    calls, responses = fake_get
+    monkeypatch.setattr(helpers, "PARALLEL_EXTRACT_MIN_SIZE", parallel_extract_min_size)
+    content = make_zip(
+        {"a.csv": "a\n" + "1\n" * 100, "b.csv": "b\n" + "2\n" * 100},
+        compression=zipfile.ZIP_STORED,
+    )
+    responses.append(FakeResponse(200, corrupt_member(content, b"2\n2\n")))
+
+    with pytest.raises(ValueError, match="Failed to extract"):
+        helpers.download_extract_zip(URL, ("a.csv", "b.csv"), str(tmp_path))
+
+    # No partial file is left, and the corrupted zip file is removed from cache
+    assert not (tmp_path / "b.csv").exists()  # nosec: B101
+    assert os.listdir(tmp_path / ".cache") == []  # nosec: B101
+
+    # Next call downloads the zip file again
+    responses.append(FakeResponse(200, content))
+    helpers.download_extract_zip(URL, ("a.csv", "b.csv"), str(tmp_path))
+
+    assert calls[1]["headers"] == {}  # nosec: B101
+    assert read(tmp_path / "b.csv") == "b\n" + "2\n" * 100  # nosec: B101
@@ -0,0 +1,185 @@
+"""Tests for the visualization helpers module"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import f_oneway
+from sklearn.linear_model import LogisticRegression
+
+from src.visualization import helpers
+
+N_ROWS = 301
+rng = np.random.default_rng(42)
+classes = rng.integers(0, 2, N_ROWS)
+
+nullable_int = pd.array(rng.integers(0, 10, N_ROWS), dtype="Int64")
+nullable_int[rng.random(N_ROWS) < 0.1] = pd.NA
+
+# Columns covering the edge cases of the one-way ANOVA
+anova_dataframe = pd.DataFrame(
+    {
+        "normal": rng.normal(size=N_ROWS) + 0.2 * classes,
+        "nan": np.where(
+            rng.random(N_ROWS) < 0.2, np.nan, rng.normal(size=N_ROWS) + 0.2 * classes
+        ),
+        "all_nan_in_class": np.where(classes == 1, np.nan, rng.normal(size=N_ROWS)),
+        "constant": np.full(N_ROWS, 0.1),
+        "constant_in_class": np.where(classes == 1, 0.1, 0.7),
+        "nullable_int": nullable_int,
+        "large_offset": 1e7 + rng.normal(size=N_ROWS) + 0.1 * classes,
+        "timestamp": 1.6e9 + rng.integers(0, 1000, N_ROWS) + 30 * classes,
+    }
+)
+
+
+def expected_p_value(column: str) -> float:
+    """P-value of `scipy.stats.f_oneway` on the NaN-dropped column."""
+    with warnings.catch_warnings():
+        # f_oneway warns about constant and empty inputs
+        warnings.simplefilter("ignore")
+        return f_oneway(
+            anova_dataframe.loc[classes == 0, column].dropna().astype(float),
+            anova_dataframe.loc[classes == 1, column].dropna().astype(float),
+        ).pvalue
+
+
+@pytest.mark.parametrize("column", anova_dataframe.columns)
+def test_oneway_anova_p_values(column):
+    values = anova_dataframe[[column]].to_numpy(dtype=float, na_value=np.nan)
+    p_values = helpers._oneway_anova_p_values(  # pylint: disable=protected-access
+        values[classes == 0],
+        values[classes == 1],
+    )
+
+    np.testing.assert_allclose(
+        p_values, [expected_p_value(column)], rtol=1e-6, equal_nan=True
+    )
+
+
+def test_plot_oneway_anova_p_values(monkeypatch):
+    plotted = []
+
+    class FakeFigure:  # pylint: disable=too-few-public-methods
+        """Figure that is not shown."""
+
+        def show(self):
+            """Do nothing."""
+
+    def fake_bar(data_frame, **kwargs):  # pylint: disable=unused-argument
+        plotted.append(data_frame)
+        return FakeFigure()
+
+    monkeypatch.setattr(helpers.px, "bar", fake_bar)
+
+    helpers.plot_oneway_anova_p_values(
+        anova_dataframe.assign(target=classes), "target", (0, 1)
+    )
+
+    anova = plotted[0]
+    for column in anova_dataframe.columns:
+        np.testing.assert_allclose(
+            anova.loc[column, "p_value"],
+            expected_p_value(column),
+            rtol=1e-6,
+            equal_nan=True,
+            err_msg=column,
+        )
+
+
+def test_box_statistics():
+    values = pd.Series([1.0, 2.0, 3.0, 4.0, 100.0, 5.0, 6.0, np.nan])
+    groups = pd.Series(["a", "a", "a", "a", "a", "b", "b", "b"])
+
+    stats = helpers._box_statistics(values, groups)  # pylint: disable=protected-access
+
+    # Hazen quartiles and population standard deviation, as Plotly computes them
+    assert stats.loc["a", ["q1", "median", "q3"]].tolist() == [  # nosec: B101
+        1.75,
+        3.0,
+        28.0,
+    ]
+    assert stats.loc["b", ["q1", "median", "q3"]].tolist() == [  # nosec: B101
+        5.0,
+        5.5,
+        6.0,
+    ]
+    assert stats.loc["b", "sd"] == 0.5  # nosec: B101
+    # 100 is an outlier, the upper fence is the largest value within 1.5 IQR
+    assert stats.loc["a", ["lowerfence", "upperfence"]].tolist() == [  # nosec: B101
+        1.0,
+        4.0,
+    ]
+
+
+def test_plot_pca_2d(monkeypatch):
+    fitted = []
+
+    class RecordedPCA(helpers.PCA):
+        """PCA that records its fitted instances."""
+
+        def fit_transform(self, X, y=None):
+            fitted.append(self)
+            return super().fit_transform(X, y)
+
+    class FakeFigure:
+        """Figure that is not shown."""
+
+        def add_shape(self, **kwargs):
+            """Do nothing."""
+
+        def add_annotation(self, **kwargs):
+            """Do nothing."""
+
+        def show(self):
+            """Do nothing."""
+
+    monkeypatch.setattr(helpers, "PCA", RecordedPCA)
+    monkeypatch.setattr(helpers.px, "scatter", lambda **kwargs: FakeFigure())
+
+    # Epoch seconds : distinct values collapse once downcast to float32
+    data = pd.DataFrame(
+        {
+            "normal": rng.normal(scale=300, size=N_ROWS),
+            "timestamp": 1.6e9 + rng.permutation(N_ROWS) * 1.0,
+        }
+    )
+    helpers.plot_pca_2d(data, pd.DataFrame({"target": classes}))
+
+    expected = helpers.PCA(n_components=2, svd_solver="full").fit(data)
+    np.testing.assert_allclose(
+        fitted[0].explained_variance_, expected.explained_variance_, rtol=1e-4
+    )
+
+
+def test_cached_permutation_importance(monkeypatch):
+    calls = []
+
+    def fake_permutation_importance(model, X, y, n_repeats, **kwargs):
+        calls.append(n_repeats)
+        return helpers.Bunch(importances_mean=model.coef_.copy())
+
+    monkeypatch.setattr(helpers, "permutation_importance", fake_permutation_importance)
+    monkeypatch.setattr(helpers, "_permutation_importances_cache", {})
+    monkeypatch.setattr(helpers, "PERMUTATION_IMPORTANCES_CACHE_SIZE", 2)
+
+    X = anova_dataframe[["normal", "large_offset"]]
+    model = LogisticRegression().fit(X, classes)
+    cached = helpers._cached_permutation_importance  # pylint: disable=protected-access
+
+    first = cached(model, X, classes, n_repeats=1)
+    assert cached(model, X, classes, n_repeats=1) is first  # nosec: B101
+    assert calls == [1]  # nosec: B101
+
+    # A model re-fitted in place gets a new key
+    model.fit(X, 1 - classes)
+    cached(model, X, classes, n_repeats=1)
+    assert calls == [1, 1]  # nosec: B101
+
+    # The oldest entry is evicted once the cache is full
+    cached(model, X, classes, n_repeats=2)
+    assert calls == [1, 1, 2]  # nosec: B101
+    model.fit(X, classes)
+    assert cached(model, X, classes, n_repeats=1) is not first  # nosec: B101
+    assert calls == [1, 1, 2, 1]  # nosec: B101